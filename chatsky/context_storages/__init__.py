@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from .database import DBContextStorage, threadsafe_method, context_storage_factory
+from .database import (
+    DBContextStorage,
+    threadsafe_method,
+    threadsafe_read_method,
+    keysafe_method,
+    context_storage_factory,
+)
 from .json import JSONContextStorage, json_available
 from .pickle import PickleContextStorage, pickle_available
 from .sql import SQLContextStorage, postgres_available, mysql_available, sqlite_available, sqlalchemy_available
@@ -10,14 +10,17 @@ This class implements the basic functionality and can be extended to add additio
 
 import asyncio
 import importlib
-import threading
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from abc import ABC, abstractmethod
-from typing import Callable, Hashable, Optional
+from typing import Callable, Dict, Hashable, Optional, Type
 
 from .protocol import PROTOCOLS
 from ..script import Context
 
+_SQL_PROTOCOLS = frozenset(name for name, protocol in PROTOCOLS.items() if protocol["module"] == "sql")
+"""Protocols that are handled by the SQL context storage and can have a driver specified after '+'."""
+
 
 class DBContextStorage(ABC):
     r"""
@@ -32,17 +35,70 @@ class DBContextStorage(ABC):
         you need to specify the location of the file, like you do in sqlite.
         Keep in mind that in Windows you will have to use double backslashes '\\'
         instead of forward slashes '/' when defining the file path.
+    :param cache_size: Number of the most recently used contexts kept in memory by the storages
+        that support caching (disabled by default).
+        Only enable it if no other process writes to the same database.
 
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache_size: int = 0):
         _, _, file_path = path.partition("://")
         self.full_path = path
         """Full path to access the context storage, as it was provided by user."""
         self.path = file_path
         """`full_path` without a prefix defining db used"""
-        self._lock = threading.Lock()
-        """Threading for methods that require single thread access."""
+        self._lock: Optional[_ReadWriteLock] = None
+        """
+        Lock for methods that access the whole storage, created once on first use.
+        Like the `_key_locks`, it is bound to the event loop it is first used in,
+        so the storage must only be used from that loop (`nest_asyncio` makes synchronous calls reuse it).
+        """
+        self._key_locks: Dict[str, asyncio.Lock] = dict()
+        """Locks for methods that require exclusive access to a single key, see :py:func:`.keysafe_method`."""
+        self._key_lock_users: Dict[str, int] = dict()
+        """Number of coroutines holding or waiting for each of the `_key_locks`."""
+        self.cache_size = cache_size
+        """Maximum number of contexts kept in `_cache`."""
+        self._cache: OrderedDict[str, Context] = OrderedDict()
+        """Copies of the recently read or written contexts, ordered from the least to the most recently used."""
+
+    def _get_cached(self, key: Hashable) -> Optional[Context]:
+        """
+        Get a copy of the cached context, so that changing it does not affect the cache.
+
+        :param key: Hashable key used to store Context instance.
+        :return: Copy of the cached context or `None` if it is not cached.
+        """
+        ctx = self._cache.get(str(key))
+        if ctx is None:
+            return None
+        self._cache.move_to_end(str(key))
+        return ctx.model_copy(deep=True)
+
+    def _set_cached(self, key: Hashable, value: Context):
+        """
+        Cache a copy of the context, evicting the least recently used one if the cache is full.
+
+        :param key: Hashable key used to store Context instance.
+        :param value: Context to cache.
+        """
+        if self.cache_size <= 0:
+            return
+        self._cache[str(key)] = value.model_copy(deep=True)
+        self._cache.move_to_end(str(key))
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _evict_cached(self, key: Optional[Hashable] = None):
+        """
+        Remove the context from the cache.
+
+        :param key: Hashable key used to store Context instance; the whole cache is cleared if it is `None`.
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(key), None)
 
     def __getitem__(self, key: Hashable) -> Context:
         """
@@ -172,15 +228,131 @@ class DBContextStorage(ABC):
         raise NotImplementedError
 
 
+class _ReadWriteLock:
+    """
+    An asyncio lock that can be held either by any number of readers or by a single writer.
+    Writers are preferred: new readers wait while a writer is waiting, so writers are not starved.
+    It is built on an `asyncio.Condition`, so it can only be used from a single event loop.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    async def acquire_read(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writing and self._waiting_writers == 0)
+            self._readers += 1
+
+    async def release_read(self):
+        async with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    async def acquire_write(self):
+        async with self._condition:
+            self._waiting_writers += 1
+            try:
+                await self._condition.wait_for(lambda: not self._writing and self._readers == 0)
+            except BaseException:
+                self._waiting_writers -= 1
+                self._condition.notify_all()
+                raise
+            self._waiting_writers -= 1
+            self._writing = True
+
+    async def release_write(self):
+        async with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+
+def _get_storage_lock(storage: DBContextStorage) -> _ReadWriteLock:
+    """
+    Get the storage-wide lock, creating it on first use.
+    The lock is created once per storage and is not recreated for other event loops,
+    as the storage is expected to be used from a single event loop.
+
+    :param storage: Context storage the lock belongs to.
+    :return: Storage read-write lock.
+    """
+    if storage._lock is None:
+        storage._lock = _ReadWriteLock()
+    return storage._lock
+
+
 def threadsafe_method(func: Callable):
     """
-    A decorator that makes sure methods of an object instance are threadsafe.
+    A decorator that makes sure asynchronous methods of an object instance are not executed concurrently.
+    The decorated coroutine is awaited while holding the instance lock exclusively,
+    so the event loop is not blocked while waiting for the lock.
+    Use it for methods that modify the storage.
     """
 
     @wraps(func)
-    def _synchronized(self, *args, **kwargs):
-        with self._lock:
-            return func(self, *args, **kwargs)
+    async def _synchronized(self, *args, **kwargs):
+        lock = _get_storage_lock(self)
+        await lock.acquire_write()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            await lock.release_write()
+
+    return _synchronized
+
+
+def threadsafe_read_method(func: Callable):
+    """
+    A decorator similar to :py:func:`.threadsafe_method` for methods that only read the storage.
+    These methods can run concurrently with each other, but not with the ones decorated
+    with :py:func:`.threadsafe_method`.
+    """
+
+    @wraps(func)
+    async def _synchronized(self, *args, **kwargs):
+        lock = _get_storage_lock(self)
+        await lock.acquire_read()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            await lock.release_read()
+
+    return _synchronized
+
+
+def keysafe_method(func: Callable):
+    """
+    A decorator that makes sure asynchronous methods of an object instance are not executed concurrently
+    for the same key, while the calls for different keys can run in parallel.
+    The decorated method should accept `key` as its first argument.
+    The storage-wide lock is held shared during the call, so the methods decorated with
+    :py:func:`.threadsafe_method` (e.g. `clear_async`) do not interleave with it.
+    Key locks are dropped as soon as no coroutine holds or waits for them.
+    """
+
+    @wraps(func)
+    async def _synchronized(self, key: Hashable, *args, **kwargs):
+        storage_lock = _get_storage_lock(self)
+        await storage_lock.acquire_read()
+        try:
+            lock_key = str(key)
+            lock = self._key_locks.get(lock_key)
+            if lock is None:
+                lock = self._key_locks[lock_key] = asyncio.Lock()
+            self._key_lock_users[lock_key] = self._key_lock_users.get(lock_key, 0) + 1
+            try:
+                async with lock:
+                    return await func(self, key, *args, **kwargs)
+            finally:
+                self._key_lock_users[lock_key] -= 1
+                if self._key_lock_users[lock_key] == 0:
+                    del self._key_lock_users[lock_key]
+                    del self._key_locks[lock_key]
+        finally:
+            await storage_lock.release_read()
 
     return _synchronized
 
@@ -214,15 +386,25 @@ def context_storage_factory(path: str, **kwargs) -> DBContextStorage:
     :param path: Path to the file.
     """
     prefix, _, _ = path.partition("://")
-    if "sql" in prefix:
-        prefix = prefix.split("+")[0]  # this takes care of alternative sql drivers
-    assert (
-        prefix in PROTOCOLS
-    ), f"""
+    return _get_storage_class(prefix)(path, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_storage_class(prefix: str) -> Type[DBContextStorage]:
+    """
+    Import the context storage class for the given URI prefix.
+    The result is cached, so the import machinery is only involved once for every prefix.
+
+    :param prefix: Database URI prefix (the part before '://').
+    :return: Context storage class.
+    """
+    protocol = prefix.split("+", 1)[0]
+    if protocol in _SQL_PROTOCOLS:
+        prefix = protocol  # this takes care of alternative sql drivers
+    assert prefix in PROTOCOLS, f"""
     URI path should be prefixed with one of the following:\n
     {", ".join(PROTOCOLS.keys())}.\n
     For more information, see the function doc:\n{context_storage_factory.__doc__}
     """
     _class, module = PROTOCOLS[prefix]["class"], PROTOCOLS[prefix]["module"]
-    target_class = getattr(importlib.import_module(f".{module}", package="chatsky.context_storages"), _class)
-    return target_class(path, **kwargs)
+    return getattr(importlib.import_module(f".{module}", package="chatsky.context_storages"), _class)
@@ -17,19 +17,18 @@ try:
 except ImportError:
     json_available = False
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel
 
-from .database import DBContextStorage, threadsafe_method
+from .database import DBContextStorage, threadsafe_method, threadsafe_read_method
 from chatsky.script import Context
 
 
 class SerializableStorage(BaseModel, extra="allow"):
-    @model_validator(mode="before")
-    @classmethod
-    def validate_any(cls, vals):
-        for key, value in vals.items():
-            vals[key] = Context.cast(value)
-        return vals
+    """
+    A container for the stored contexts, mapping context ids to their serialized representations.
+    Values are kept as they were loaded and are only cast to :py:class:`~.Context`
+    when accessed by key, so reading a single context doesn't validate the whole storage.
+    """
 
 
 class JSONContextStorage(DBContextStorage):
@@ -43,7 +42,7 @@ class JSONContextStorage(DBContextStorage):
         DBContextStorage.__init__(self, path)
         asyncio.run(self._load())
 
-    @threadsafe_method
+    @threadsafe_read_method
     async def len_async(self) -> int:
         return len(self.storage.model_extra)
 
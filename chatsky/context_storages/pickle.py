@@ -23,7 +23,7 @@ try:
 except ImportError:
     pickle_available = False
 
-from .database import DBContextStorage, threadsafe_method
+from .database import DBContextStorage, threadsafe_method, threadsafe_read_method
 from chatsky.script import Context
 
 
@@ -38,7 +38,7 @@ class PickleContextStorage(DBContextStorage):
         DBContextStorage.__init__(self, path)
         asyncio.run(self._load())
 
-    @threadsafe_method
+    @threadsafe_read_method
     async def len_async(self) -> int:
         return len(self.dict)
 
@@ -15,21 +15,16 @@ public-domain, SQL database engine.
 
 import asyncio
 import importlib
+import importlib.util
 import json
-from typing import Hashable
+from typing import Any, Dict, Hashable, Optional
 
 from chatsky.script import Context
 
-from .database import DBContextStorage, threadsafe_method
+from .database import DBContextStorage, threadsafe_method, threadsafe_read_method, keysafe_method
 from .protocol import get_protocol_install_suggestion
 
-try:
-    from sqlalchemy import Table, MetaData, Column, JSON, String, inspect, select, delete, func
-    from sqlalchemy.ext.asyncio import create_async_engine
-
-    sqlalchemy_available = True
-except (ImportError, ModuleNotFoundError):
-    sqlalchemy_available = False
+sqlalchemy_available = importlib.util.find_spec("sqlalchemy") is not None
 
 postgres_available = sqlite_available = mysql_available = False
 
@@ -64,6 +59,17 @@ if not sqlalchemy_available:
     postgres_available = sqlite_available = mysql_available = False
 
 
+def import_sqlalchemy():
+    """
+    Imports the required sqlalchemy objects into global scope.
+    Importing sqlalchemy takes a noticeable time, so it is postponed until an SQL storage is created.
+    """
+    global Table, MetaData, Column, JSON, String, inspect, select, delete, func, bindparam
+    global create_async_engine
+    from sqlalchemy import Table, MetaData, Column, JSON, String, inspect, select, delete, func, bindparam
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+
 def import_insert_for_dialect(dialect: str):
     """
     Imports the insert function into global scope depending on the chosen sqlalchemy dialect.
@@ -77,6 +83,25 @@ def import_insert_for_dialect(dialect: str):
     )
 
 
+def _get_sqlite_update_stmt(insert_stmt):
+    return insert_stmt
+
+
+def _get_on_duplicate_key_update_stmt(insert_stmt):
+    return insert_stmt.on_duplicate_key_update(context=insert_stmt.inserted.context)
+
+
+def _get_on_conflict_update_stmt(insert_stmt):
+    return insert_stmt.on_conflict_do_update(index_elements=["id"], set_=dict(context=insert_stmt.excluded.context))
+
+
+_UPDATE_STMT_GETTERS = {
+    "sqlite": _get_sqlite_update_stmt,
+    "mysql": _get_on_duplicate_key_update_stmt,
+}
+"""Upsert statement builders by sqlalchemy dialect; other dialects use `ON CONFLICT DO UPDATE`."""
+
+
 class SQLContextStorage(DBContextStorage):
     """
     | SQL-based version of the :py:class:`.DBContextStorage`.
@@ -88,13 +113,25 @@ class SQLContextStorage(DBContextStorage):
     :param table_name: The name of the table to use.
     :param custom_driver: If you intend to use some other database driver instead of the recommended ones,
         set this parameter to `True` to bypass the import checks.
+    :param cache_size: Number of the most recently used contexts kept in memory (disabled by default).
+    :param engine_kwargs: Additional keyword arguments for `create_async_engine`,
+        e.g. `pool_size` and `max_overflow` to size the connection pool for the expected load.
     """
 
-    def __init__(self, path: str, table_name: str = "contexts", custom_driver: bool = False):
-        DBContextStorage.__init__(self, path)
+    def __init__(
+        self,
+        path: str,
+        table_name: str = "contexts",
+        custom_driver: bool = False,
+        cache_size: int = 0,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        DBContextStorage.__init__(self, path, cache_size)
 
         self._check_availability(custom_driver)
-        self.engine = create_async_engine(self.full_path, pool_pre_ping=True)
+        import_sqlalchemy()
+        engine_kwargs = {"pool_pre_ping": True, **(engine_kwargs or dict())}
+        self.engine = create_async_engine(self.full_path, **engine_kwargs)
         self.dialect: str = self.engine.dialect.name
 
         id_column_args = {"primary_key": True}
@@ -112,44 +149,46 @@ class SQLContextStorage(DBContextStorage):
         asyncio.run(self._create_self_table())
 
         import_insert_for_dialect(self.dialect)
+        self._create_statements()
 
-    @threadsafe_method
+    @keysafe_method
     async def set_item_async(self, key: Hashable, value: Context):
-        value = value if isinstance(value, Context) else Context.cast(value)
-        value = json.loads(value.model_dump_json())
-
-        insert_stmt = insert(self.table).values(id=str(key), context=value)
-        update_stmt = await self._get_update_stmt(insert_stmt)
+        ctx = value if isinstance(value, Context) else Context.cast(value)
+        value = json.loads(ctx.model_dump_json())
 
         async with self.engine.connect() as conn:
-            await conn.execute(update_stmt)
+            await conn.execute(self._upsert_stmt, {"key": str(key), "context_value": value})
             await conn.commit()
+        self._set_cached(key, ctx)
 
-    @threadsafe_method
+    @keysafe_method
     async def get_item_async(self, key: Hashable) -> Context:
-        stmt = select(self.table.c.context).where(self.table.c.id == str(key))
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
         async with self.engine.connect() as conn:
-            result = await conn.execute(stmt)
+            result = await conn.execute(self._select_stmt, {"key": str(key)})
             row = result.fetchone()
             if row:
-                return Context.cast(row[0])
+                ctx = Context.cast(row[0])
+                self._set_cached(key, ctx)
+                return ctx
         raise KeyError
 
-    @threadsafe_method
+    @keysafe_method
     async def del_item_async(self, key: Hashable):
-        stmt = delete(self.table).where(self.table.c.id == str(key))
         async with self.engine.connect() as conn:
-            await conn.execute(stmt)
+            await conn.execute(self._delete_stmt, {"key": str(key)})
             await conn.commit()
+        self._evict_cached(key)
 
-    @threadsafe_method
+    @keysafe_method
     async def contains_async(self, key: Hashable) -> bool:
-        stmt = select(self.table.c.context).where(self.table.c.id == str(key))
         async with self.engine.connect() as conn:
-            result = await conn.execute(stmt)
+            result = await conn.execute(self._contains_stmt, {"key": str(key)})
             return bool(result.fetchone())
 
-    @threadsafe_method
+    @threadsafe_read_method
     async def len_async(self) -> int:
         stmt = select(func.count()).select_from(self.table)
         async with self.engine.connect() as conn:
@@ -162,23 +201,27 @@ class SQLContextStorage(DBContextStorage):
         async with self.engine.connect() as conn:
             await conn.execute(stmt)
             await conn.commit()
+        self._evict_cached()
+
+    def _create_statements(self):
+        """
+        Build the statements used for the item operations once, with the key and the context as bound parameters.
+        Reusing the same statement objects lets sqlalchemy take their compiled form from its cache
+        instead of constructing and compiling them on every call.
+        """
+        key_param = bindparam("key", type_=self.table.c.id.type)
+        context_param = bindparam("context_value", type_=self.table.c.context.type)
+        get_update_stmt = _UPDATE_STMT_GETTERS.get(self.dialect, _get_on_conflict_update_stmt)
+        self._upsert_stmt = get_update_stmt(insert(self.table).values(id=key_param, context=context_param))
+        self._select_stmt = select(self.table.c.context).where(self.table.c.id == key_param)
+        self._contains_stmt = select(self.table.c.id).where(self.table.c.id == key_param)
+        self._delete_stmt = delete(self.table).where(self.table.c.id == key_param)
 
     async def _create_self_table(self):
         async with self.engine.begin() as conn:
             if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(self.table.name)):
                 await conn.run_sync(self.table.create, self.engine)
 
-    async def _get_update_stmt(self, insert_stmt):
-        if self.dialect == "sqlite":
-            return insert_stmt
-        elif self.dialect == "mysql":
-            update_stmt = insert_stmt.on_duplicate_key_update(context=insert_stmt.inserted.context)
-        else:
-            update_stmt = insert_stmt.on_conflict_do_update(
-                index_elements=["id"], set_=dict(context=insert_stmt.excluded.context)
-            )
-        return update_stmt
-
     def _check_availability(self, custom_driver: bool):
         if not custom_driver:
             if self.full_path.startswith("postgresql") and not postgres_available:
@@ -625,14 +625,14 @@ class _AbstractTelegramInterface(MessengerInterfaceWithAttachments):
         """
 
         data_available = update.message is not None or update.callback_query is not None
-        if update.effective_chat is not None and data_available:
+        effective_chat = update.effective_chat
+        if effective_chat is not None and data_available:
             message = create_message(update)
             message.original_message = update
-            resp = await self._pipeline_runner(message, update.effective_chat.id)
-            if resp.last_response is not None:
-                await self.cast_message_to_telegram_and_send(
-                    self.application.bot, update.effective_chat.id, resp.last_response
-                )
+            resp = await self._pipeline_runner(message, effective_chat.id)
+            last_response = resp.last_response
+            if last_response is not None:
+                await self.cast_message_to_telegram_and_send(self.application.bot, effective_chat.id, last_response)
 
     async def on_message(self, update: Update, _: Any) -> None:
         """
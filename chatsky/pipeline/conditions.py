@@ -40,8 +40,7 @@ def service_successful_condition(path: Optional[str] = None) -> StartConditionCh
     """
 
     def check_service_state(ctx: Context, _: Pipeline):
-        state = ctx.framework_data.service_states.get(path, ComponentExecutionState.NOT_RUN)
-        return ComponentExecutionState[state] == ComponentExecutionState.FINISHED
+        return ctx.framework_data.service_states.get(path) == ComponentExecutionState.FINISHED
 
     return check_service_state
 
@@ -67,12 +66,14 @@ def aggregate_condition(
     Condition that returns aggregated boolean value from all booleans returned by incoming functions.
     Returns :py:data:`~.StartConditionCheckerFunction`.
 
-    :param aggregator: The function that accepts list of booleans and returns a single boolean.
+    :param aggregator: The function that accepts an iterable of booleans and returns a single boolean.
+        The booleans are computed lazily, so aggregators like `all` or `any` can stop
+        calling the functions as soon as the result is known.
     :param functions: Functions to aggregate.
     """
 
     def aggregation_function(ctx: Context, pipeline: Pipeline):
-        return aggregator([func(ctx, pipeline) for func in functions])
+        return aggregator(func(ctx, pipeline) for func in functions)
 
     return aggregation_function
 
@@ -84,7 +85,11 @@ def all_condition(*functions: StartConditionCheckerFunction) -> StartConditionCh
 
     :param functions: Functions to aggregate.
     """
-    return aggregate_condition(all, *functions)
+
+    def all_function(ctx: Context, pipeline: Pipeline):
+        return all(func(ctx, pipeline) for func in functions)
+
+    return all_function
 
 
 def any_condition(*functions: StartConditionCheckerFunction) -> StartConditionCheckerFunction:
@@ -94,4 +99,8 @@ def any_condition(*functions: StartConditionCheckerFunction) -> StartConditionCh
 
     :param functions: Functions to aggregate.
     """
-    return aggregate_condition(any, *functions)
+
+    def any_function(ctx: Context, pipeline: Pipeline):
+        return any(func(ctx, pipeline) for func in functions)
+
+    return any_function
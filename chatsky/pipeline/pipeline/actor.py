@@ -80,15 +80,17 @@ class Actor:
         self.label_priority = label_priority
 
         self.start_label = normalize_label(start_label)
-        if self.script.get(self.start_label[0], {}).get(self.start_label[1]) is None:
+        self.start_node = self.script.get(self.start_label[0], {}).get(self.start_label[1])
+        if self.start_node is None:
             raise ValueError(f"Unknown start_label={self.start_label}")
 
         if fallback_label is None:
             self.fallback_label = self.start_label
         else:
             self.fallback_label = normalize_label(fallback_label)
-            if self.script.get(self.fallback_label[0], {}).get(self.fallback_label[1]) is None:
-                raise ValueError(f"Unknown fallback_label={self.fallback_label}")
+            if self.fallback_label[:2] != self.start_label[:2]:
+                if self.script.get(self.fallback_label[0], {}).get(self.fallback_label[1]) is None:
+                    raise ValueError(f"Unknown fallback_label={self.fallback_label}")
         self.condition_handler = default_condition_handler if condition_handler is None else condition_handler
 
         self.handlers = {} if handlers is None else handlers
@@ -143,12 +145,14 @@ class Actor:
         ctx.framework_data.actor_data.clear()
 
     def _get_previous_node(self, ctx: Context):
-        ctx.framework_data.actor_data["previous_label"] = (
-            normalize_label(ctx.last_label) if ctx.last_label else self.start_label
-        )
-        ctx.framework_data.actor_data["previous_node"] = self.script.get(
-            ctx.framework_data.actor_data["previous_label"][0], {}
-        ).get(ctx.framework_data.actor_data["previous_label"][1], Node())
+        last_label = ctx.last_label
+        if last_label:
+            previous_label = normalize_label(last_label)
+            previous_node = self.script.get(previous_label[0], {}).get(previous_label[1], Node())
+        else:
+            previous_label, previous_node = self.start_label, self.start_node
+        ctx.framework_data.actor_data["previous_label"] = previous_label
+        ctx.framework_data.actor_data["previous_node"] = previous_node
 
     async def _get_true_labels(self, ctx: Context, pipeline: Pipeline):
         # GLOBAL
@@ -256,7 +260,10 @@ class Actor:
         for exc, (processing_name, processing_func) in zip(results, processing.items()):
             if isinstance(exc, Exception):
                 logger.error(
-                    f"Exception {exc} for processing_name={processing_name} and processing_func={processing_func}",
+                    "Exception %s for processing_name=%s and processing_func=%s",
+                    exc,
+                    processing_name,
+                    processing_func,
                     exc_info=exc,
                 )
 
@@ -271,7 +278,10 @@ class Actor:
                 await wrap_sync_function_in_async(processing_func, ctx, pipeline)
             except Exception as exc:
                 logger.error(
-                    f"Exception {exc} for processing_name={processing_name} and processing_func={processing_func}",
+                    "Exception %s for processing_name=%s and processing_func=%s",
+                    exc,
+                    processing_name,
+                    processing_func,
                     exc_info=exc,
                 )
 
@@ -344,9 +354,11 @@ class Actor:
             + ((self.label_priority if label[2] == float("-inf") else label[2]),)
             for label in true_labels
         ]
-        true_labels.sort(key=lambda label: -label[2])
-        true_label = true_labels[0] if true_labels else None
-        logger.debug(f"{transition_info} transitions sorted by priority = {true_labels}")
+        # `max` keeps the first of equally prioritized labels, just like the stable sort used for logging
+        true_label = max(true_labels, key=lambda label: label[2]) if true_labels else None
+        if logger.isEnabledFor(logging.DEBUG):
+            true_labels.sort(key=lambda label: -label[2])
+            logger.debug(f"{transition_info} transitions sorted by priority = {true_labels}")
         return true_label
 
     async def _run_handlers(self, ctx, pipeline: Pipeline, actor_stage: ActorStage):
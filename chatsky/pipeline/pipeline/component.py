@@ -13,7 +13,7 @@ from __future__ import annotations
 import logging
 import abc
 import asyncio
-from typing import Optional, Awaitable, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from chatsky.script import Context
 
@@ -31,6 +31,9 @@ from ..types import (
 
 logger = logging.getLogger(__name__)
 
+_asyncio_timeout_available = hasattr(asyncio, "timeout")
+"""Whether `asyncio.timeout` context manager (Python 3.11+) can be used instead of `asyncio.wait_for`."""
+
 if TYPE_CHECKING:
     from chatsky.pipeline.pipeline.pipeline import Pipeline
 
@@ -124,7 +127,7 @@ class PipelineComponent(abc.ABC):
             (usually it's :py:attr:`~.pipeline.types.ComponentExecutionState.NOT_RUN`).
         :return: :py:class:`~pipeline.types.ComponentExecutionState` of this service or default if not found.
         """
-        return ctx.framework_data.service_states.get(self.path, default if default is not None else None)
+        return ctx.framework_data.service_states.get(self.path, default)
 
     @property
     def asynchronous(self) -> bool:
@@ -150,14 +153,12 @@ class PipelineComponent(abc.ABC):
             extra_handler = self.before_handler
         if stage == ExtraHandlerType.AFTER:
             extra_handler = self.after_handler
-        if extra_handler is None:
+        if extra_handler is None or len(extra_handler.functions) == 0:
             return
         try:
-            extra_handler_result = await extra_handler(ctx, pipeline, self._get_runtime_info(ctx))
-            if extra_handler.asynchronous and isinstance(extra_handler_result, Awaitable):
-                await extra_handler_result
+            await extra_handler(ctx, pipeline, self._get_runtime_info(ctx))
         except asyncio.TimeoutError:
-            logger.warning(f"{type(self).__name__} '{self.name}' {extra_handler.stage} extra handler timed out!")
+            logger.warning("%s '%s' %s extra handler timed out!", type(self).__name__, self.name, extra_handler.stage)
 
     @abc.abstractmethod
     async def _run(self, ctx: Context, pipeline: Pipeline) -> None:
@@ -170,20 +171,31 @@ class PipelineComponent(abc.ABC):
         """
         raise NotImplementedError
 
-    async def __call__(self, ctx: Context, pipeline: Pipeline) -> Optional[Awaitable]:
+    async def __call__(self, ctx: Context, pipeline: Pipeline) -> None:
         """
         A method for calling pipeline components.
         It sets up timeout if this component is asynchronous and executes it using :py:meth:`~._run` method.
+        The component is fully executed once the call is awaited; if it runs out of its timeout,
+        it is aborted and marked as failed.
+        The component is awaited directly, without creating a separate task (unless `asyncio.timeout`
+        is unavailable and the timeout is set).
 
         :param ctx: Current dialog :py:class:`~.Context`.
         :param pipeline: This :py:class:`~.Pipeline`.
-        :return: `None` if the service is synchronous; an `Awaitable` otherwise.
+        :return: `None`
         """
-        if self.asynchronous:
-            task = asyncio.create_task(self._run(ctx, pipeline))
-            return asyncio.wait_for(task, timeout=self.timeout)
+        if self.asynchronous and self.timeout is not None:
+            try:
+                if _asyncio_timeout_available:
+                    async with asyncio.timeout(self.timeout):
+                        await self._run(ctx, pipeline)
+                else:
+                    await asyncio.wait_for(self._run(ctx, pipeline), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self._set_state(ctx, ComponentExecutionState.FAILED)
+                logger.warning("%s '%s' timed out!", type(self).__name__, self.name)
         else:
-            return await self._run(ctx, pipeline)
+            await self._run(ctx, pipeline)
 
     def add_extra_handler(self, global_extra_handler_type: GlobalExtraHandlerType, extra_handler: ExtraHandlerFunction):
         """
@@ -212,7 +224,7 @@ class PipelineComponent(abc.ABC):
             path=self.path if self.path is not None else "[None]",
             timeout=self.timeout,
             asynchronous=self.asynchronous,
-            execution_state=ctx.framework_data.service_states.copy(),
+            execution_state=ctx.framework_data.service_states,  # copied by pydantic validation
         )
 
     @property
@@ -17,16 +17,15 @@ to structure and manage the messages processing flow.
 import asyncio
 import logging
 from typing import Union, List, Dict, Optional, Hashable, Callable
-from collections import defaultdict
 
 from chatsky.context_storages import DBContextStorage
 from chatsky.script import Script, Context, ActorStage
 from chatsky.script import NodeLabel2Type, Message
-from chatsky.utils.turn_caching import cache_clear
+from chatsky.utils.turn_caching import start_turn_caching, stop_turn_caching
 
 from chatsky.messengers.console import CLIMessengerInterface
 from chatsky.messengers.common import MessengerInterface
-from chatsky.slots.slots import GroupSlot, RegexpSlot, FunctionSlot
+from chatsky.slots.slots import GroupSlot
 from ..service.group import ServiceGroup
 from ..types import (
     ServiceBuilder,
@@ -165,9 +164,6 @@ class Pipeline:
         :return: `None`
         """
 
-        def condition(name: str) -> bool:
-            return (whitelist is None or name in whitelist) and (blacklist is None or name not in blacklist)
-
         if (
             global_handler_type is GlobalExtraHandlerType.BEFORE_ALL
             or global_handler_type is GlobalExtraHandlerType.AFTER_ALL
@@ -178,6 +174,11 @@ class Pipeline:
                 if global_handler_type is GlobalExtraHandlerType.BEFORE_ALL
                 else GlobalExtraHandlerType.AFTER
             )
+        whitelist = None if whitelist is None else set(whitelist)
+        blacklist = None if blacklist is None else set(blacklist)
+
+        def condition(name: str) -> bool:
+            return (whitelist is None or name in whitelist) and (blacklist is None or name not in blacklist)
 
         self._services_pipeline.add_extra_handler(global_handler_type, extra_handler, condition)
 
@@ -357,33 +358,39 @@ class Pipeline:
         Method that should be invoked on user input.
         This method has the same signature as :py:class:`~chatsky.pipeline.types.PipelineRunnerFunction`.
         """
+        is_db_storage = isinstance(self.context_storage, DBContextStorage)
         if ctx_id is None:
             ctx = Context()
-        elif isinstance(self.context_storage, DBContextStorage):
-            ctx = await self.context_storage.get_async(ctx_id, Context(id=ctx_id))
         else:
-            ctx = self.context_storage.get(ctx_id, Context(id=ctx_id))
+            if is_db_storage:
+                ctx = await self.context_storage.get_async(ctx_id)
+            else:
+                ctx = self.context_storage.get(ctx_id)
+            if ctx is None:
+                ctx = Context(id=ctx_id)
 
         if update_ctx_misc is not None:
             ctx.misc.update(update_ctx_misc)
 
-        if self.slots is not None:
+        if self.slots is not None and ctx.framework_data.slot_manager.root_slot is not self.slots:
             ctx.framework_data.slot_manager.set_root_slot(self.slots)
 
         ctx.add_request(request)
-        result = await self._services_pipeline(ctx, self)
-
-        if asyncio.iscoroutine(result):
-            await result
+        if self._clean_turn_cache:
+            turn_caching_token = start_turn_caching()
+            try:
+                await self._services_pipeline(ctx, self)
+            finally:
+                stop_turn_caching(turn_caching_token)
+        else:
+            await self._services_pipeline(ctx, self)
 
         ctx.framework_data.service_states.clear()
 
-        if isinstance(self.context_storage, DBContextStorage):
+        if is_db_storage:
             await self.context_storage.set_item_async(ctx_id, ctx)
         else:
             self.context_storage[ctx_id] = ctx
-        if self._clean_turn_cache:
-            cache_clear()
 
         return ctx
 
@@ -88,8 +88,9 @@ def rename_component_incrementing(
     else:
         base_name = "noname_service"
 
+    collision_names = {component.name for component in collisions}
     name_index = 0
-    while f"{base_name}_{name_index}" in [component.name for component in collisions]:
+    while f"{base_name}_{name_index}" in collision_names:
         name_index += 1
     return f"{base_name}_{name_index}"
 
@@ -9,12 +9,11 @@ For example, it is used to grep statistics from components, timing, logging, etc
 from __future__ import annotations
 import asyncio
 import logging
-import inspect
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 
 from chatsky.script import Context
 
-from .utils import collect_defined_constructor_parameters_to_dict, _get_attrs_with_updates
+from .utils import collect_defined_constructor_parameters_to_dict, _get_attrs_with_updates, _get_parameters_number
 from chatsky.utils.devel.async_helpers import wrap_sync_function_in_async
 from ..types import (
     ServiceRuntimeInfo,
@@ -61,7 +60,7 @@ class _ComponentExtraHandler:
             self.__init__(
                 **_get_attrs_with_updates(
                     functions,
-                    ("calculated_async_flag", "stage"),
+                    ("calculated_async_flag", "stage", "_functions_params"),
                     {"requested_async_flag": "asynchronous"},
                     overridden_parameters,
                 )
@@ -75,6 +74,7 @@ class _ComponentExtraHandler:
             self.requested_async_flag = asynchronous
             self.calculated_async_flag = all([asyncio.iscoroutinefunction(func) for func in self.functions])
             self.stage = stage
+            self._functions_params: Dict[int, Tuple[ExtraHandlerFunction, int]] = {}
         else:
             raise Exception(f"Unknown type for {type(self).__name__} {functions}")
 
@@ -96,10 +96,24 @@ class _ComponentExtraHandler:
         """
         return self.calculated_async_flag if self.requested_async_flag is None else self.requested_async_flag
 
+    def _get_function_params(self, func: ExtraHandlerFunction) -> int:
+        """
+        Get number of parameters of one of the `functions`.
+        The number is counted on the first run of each function and stored for the following runs.
+
+        :param func: One of the extra handler functions.
+        :return: Number of `func` parameters.
+        """
+        stored_func, handler_params = self._functions_params.get(id(func), (None, 0))
+        if stored_func is not func:
+            handler_params = _get_parameters_number(func)
+            self._functions_params[id(func)] = (func, handler_params)
+        return handler_params
+
     async def _run_function(
         self, func: ExtraHandlerFunction, ctx: Context, pipeline: Pipeline, component_info: ServiceRuntimeInfo
     ):
-        handler_params = len(inspect.signature(func).parameters)
+        handler_params = self._get_function_params(func)
         if handler_params == 1:
             await wrap_sync_function_in_async(func, ctx)
         elif handler_params == 2:
@@ -130,7 +144,9 @@ class _ComponentExtraHandler:
                 try:
                     await future
                 except asyncio.TimeoutError:
-                    logger.warning(f"Component {component_info.name} {self.stage} wrapper '{func.__name__}' timed out!")
+                    logger.warning(
+                        "Component %s %s wrapper '%s' timed out!", component_info.name, self.stage, func.__name__
+                    )
 
         else:
             for func in self.functions:
@@ -11,7 +11,7 @@ The :py:class:`~.ServiceGroup` serves the important function of grouping service
 from __future__ import annotations
 import asyncio
 import logging
-from typing import Optional, List, Union, Awaitable, TYPE_CHECKING
+from typing import Optional, List, Union, TYPE_CHECKING
 
 from chatsky.script import Context
 
@@ -110,25 +110,17 @@ class ServiceGroup(PipelineComponent):
         :param ctx: Current dialog context.
         :param pipeline: The current pipeline.
         """
-        self._set_state(ctx, ComponentExecutionState.RUNNING)
+        service_states = ctx.framework_data.service_states
+        service_states[self.path] = ComponentExecutionState.RUNNING
 
         if self.asynchronous:
-            service_futures = [service(ctx, pipeline) for service in self.components]
-            for service, future in zip(self.components, await asyncio.gather(*service_futures, return_exceptions=True)):
-                service_result = future
-                if service.asynchronous and isinstance(service_result, Awaitable):
-                    await service_result
-                elif isinstance(service_result, asyncio.TimeoutError):
-                    logger.warning(f"{type(service).__name__} '{service.name}' timed out!")
-
+            await asyncio.gather(*[service(ctx, pipeline) for service in self.components], return_exceptions=True)
         else:
             for service in self.components:
-                service_result = await service(ctx, pipeline)
-                if service.asynchronous and isinstance(service_result, Awaitable):
-                    await service_result
+                await service(ctx, pipeline)
 
-        failed = any([service.get_state(ctx) == ComponentExecutionState.FAILED for service in self.components])
-        self._set_state(ctx, ComponentExecutionState.FAILED if failed else ComponentExecutionState.FINISHED)
+        failed = any(service_states.get(service.path) == ComponentExecutionState.FAILED for service in self.components)
+        service_states[self.path] = ComponentExecutionState.FAILED if failed else ComponentExecutionState.FINISHED
 
     async def _run(
         self,
@@ -152,7 +144,7 @@ class ServiceGroup(PipelineComponent):
 
         except Exception as exc:
             self._set_state(ctx, ComponentExecutionState.FAILED)
-            logger.error(f"ServiceGroup '{self.name}' execution failed!", exc_info=exc)
+            logger.error("ServiceGroup '%s' execution failed!", self.name, exc_info=exc)
 
         await self.run_extra_handler(ExtraHandlerType.AFTER, ctx, pipeline)
 
@@ -11,14 +11,13 @@ Actor wrapping service is asynchronous.
 """
 
 from __future__ import annotations
+import asyncio
 import logging
-import inspect
 from typing import Optional, TYPE_CHECKING
 
 from chatsky.script import Context
 
-from .utils import collect_defined_constructor_parameters_to_dict, _get_attrs_with_updates
-from chatsky.utils.devel.async_helpers import wrap_sync_function_in_async
+from .utils import collect_defined_constructor_parameters_to_dict, _get_attrs_with_updates, _get_parameters_number
 from ..types import (
     ServiceBuilder,
     StartConditionCheckerFunction,
@@ -83,6 +82,8 @@ class Service(PipelineComponent):
                     (
                         "calculated_async_flag",
                         "path",
+                        "_handler_is_coroutine",
+                        "_handler_params",
                     ),
                     {"requested_async_flag": "asynchronous"},
                     overridden_parameters,
@@ -90,6 +91,8 @@ class Service(PipelineComponent):
             )
         elif callable(handler) or isinstance(handler, str) and handler == "ACTOR":
             self.handler = handler
+            self._handler_is_coroutine = asyncio.iscoroutinefunction(handler)
+            self._handler_params = _get_parameters_number(handler) if callable(handler) else None
             super(Service, self).__init__(
                 before_handler,
                 after_handler,
@@ -117,15 +120,17 @@ class Service(PipelineComponent):
         :param pipeline: The current pipeline.
         :return: `None`
         """
-        handler_params = len(inspect.signature(self.handler).parameters)
+        handler_params = self._handler_params
         if handler_params == 1:
-            await wrap_sync_function_in_async(self.handler, ctx)
+            result = self.handler(ctx)
         elif handler_params == 2:
-            await wrap_sync_function_in_async(self.handler, ctx, pipeline)
+            result = self.handler(ctx, pipeline)
         elif handler_params == 3:
-            await wrap_sync_function_in_async(self.handler, ctx, pipeline, self._get_runtime_info(ctx))
+            result = self.handler(ctx, pipeline, self._get_runtime_info(ctx))
         else:
             raise Exception(f"Too many parameters required for service '{self.name}' handler: {handler_params}!")
+        if self._handler_is_coroutine:
+            await result
 
     async def _run_as_actor(self, ctx: Context, pipeline: Pipeline) -> None:
         """
@@ -139,7 +144,7 @@ class Service(PipelineComponent):
             self._set_state(ctx, ComponentExecutionState.FINISHED)
         except Exception as exc:
             self._set_state(ctx, ComponentExecutionState.FAILED)
-            logger.error(f"Actor '{self.name}' execution failed!", exc_info=exc)
+            logger.error("Actor '%s' execution failed!", self.name, exc_info=exc)
 
     async def _run_as_service(self, ctx: Context, pipeline: Pipeline) -> None:
         """
@@ -149,16 +154,17 @@ class Service(PipelineComponent):
         :param ctx: Current dialog context.
         :param pipeline: Current pipeline.
         """
+        service_states = ctx.framework_data.service_states
         try:
             if self.start_condition(ctx, pipeline):
-                self._set_state(ctx, ComponentExecutionState.RUNNING)
+                service_states[self.path] = ComponentExecutionState.RUNNING
                 await self._run_handler(ctx, pipeline)
-                self._set_state(ctx, ComponentExecutionState.FINISHED)
+                service_states[self.path] = ComponentExecutionState.FINISHED
             else:
-                self._set_state(ctx, ComponentExecutionState.NOT_RUN)
+                service_states[self.path] = ComponentExecutionState.NOT_RUN
         except Exception as exc:
-            self._set_state(ctx, ComponentExecutionState.FAILED)
-            logger.error(f"Service '{self.name}' execution failed!", exc_info=exc)
+            service_states[self.path] = ComponentExecutionState.FAILED
+            logger.error("Service '%s' execution failed!", self.name, exc_info=exc)
 
     async def _run(self, ctx: Context, pipeline: Pipeline) -> None:
         """
@@ -5,7 +5,8 @@ The Utility Functions module contains several utility functions that are commonl
 These functions provide a variety of utility functionality.
 """
 
-from typing import Any, Optional, Tuple, Mapping
+import inspect
+from typing import Any, Callable, Optional, Tuple, Mapping
 
 
 def _get_attrs_with_updates(
@@ -41,6 +42,17 @@ def _get_attrs_with_updates(
     return result
 
 
+def _get_parameters_number(func: Callable) -> int:
+    """
+    Get number of parameters of a service handler or an extra handler function.
+    It is meant to be called once, when the handler is added, and stored with it.
+
+    :param func: Function to inspect.
+    :return: Number of `func` parameters.
+    """
+    return len(inspect.signature(func).parameters)
+
+
 def collect_defined_constructor_parameters_to_dict(**kwargs: Any):
     """
     Function, that creates dict from non-`None` constructor parameters of pipeline component.
@@ -42,8 +42,38 @@ def get_last_index(dictionary: dict) -> int:
     :param dictionary: Dictionary with unsorted keys.
     :return: Last index from the `dictionary`.
     """
-    indices = list(dictionary)
-    return indices[-1] if indices else -1
+    return next(reversed(dictionary), -1)
+
+
+_EMPTY_MESSAGE = Message()
+"""Template for the empty messages set by `last_request`/`last_response` setters; only its copies are used."""
+
+
+def _hold_last_items(dictionary: dict, hold_last_n_indices: int):
+    """
+    Delete all the items from the `dictionary` except for the last `hold_last_n_indices` ones.
+    Kept items are copied and re-inserted instead of deleting the other ones one by one.
+
+    :param dictionary: Dictionary to clear.
+    :param hold_last_n_indices: Number of last items to keep.
+    """
+    kept_keys = list(dictionary)[-hold_last_n_indices:]
+    if len(kept_keys) < len(dictionary):
+        kept_items = {key: dictionary[key] for key in kept_keys}
+        dictionary.clear()
+        dictionary.update(kept_items)
+
+
+def _validate_message(message: Message) -> Message:
+    """
+    Validate `message` as a :py:class:`~.Message`.
+    Instances of :py:class:`~.Message` are returned as is (the same way pydantic does that),
+    skipping the comparatively expensive validator call.
+
+    :param message: Message instance or data to validate.
+    :return: Validated message.
+    """
+    return message if isinstance(message, Message) else Message.model_validate(message)
 
 
 class FrameworkData(BaseModel):
@@ -117,14 +147,18 @@ class Context(BaseModel):
         """
         Sort the keys in the `dictionary`. This needs to be done after deserialization,
         since the keys are deserialized in a random order.
+        Dictionaries that are already sorted (the usual case) are returned as is.
 
         :param dictionary: Dictionary with unsorted keys.
         :return: Dictionary with sorted keys.
         """
-        return {key: dictionary[key] for key in sorted(dictionary)}
+        keys = list(dictionary)
+        if all(previous < current for previous, current in zip(keys, keys[1:])):
+            return dictionary
+        return {key: dictionary[key] for key in sorted(keys)}
 
     @classmethod
-    def cast(cls, ctx: Optional[Union[Context, dict, str]] = None, *args, **kwargs) -> Context:
+    def cast(cls, ctx: Optional[Union[Context, dict, str, bytes]] = None, *args, **kwargs) -> Context:
         """
         Transform different data types to the objects of the
         :py:class:`~.Context` class.
@@ -134,19 +168,23 @@ class Context(BaseModel):
         :param ctx: Data that is used to initialize an object of the
             :py:class:`~.Context` type.
             An empty :py:class:`~.Context` object is returned if no data is given.
+            JSON strings (or bytes) are parsed and validated in one pass,
+            so they should be passed as is rather than decoded into a dict first.
         :return: Object of the :py:class:`~.Context`
             type that is initialized by the input data.
         """
+        if isinstance(ctx, Context):
+            return ctx
         if not ctx:
             ctx = Context(*args, **kwargs)
         elif isinstance(ctx, dict):
             ctx = Context.model_validate(ctx)
-        elif isinstance(ctx, str):
+        elif isinstance(ctx, (str, bytes, bytearray)):
             ctx = Context.model_validate_json(ctx)
-        elif not isinstance(ctx, Context):
+        else:
             raise ValueError(
                 f"Context expected to be an instance of the Context class "
-                f"or an instance of the dict/str(json) type. Got: {type(ctx)}"
+                f"or an instance of the dict/str(json)/bytes(json) type. Got: {type(ctx)}"
             )
         return ctx
 
@@ -157,7 +195,7 @@ class Context(BaseModel):
 
         :param request: `request` to be added to the context.
         """
-        request_message = Message.model_validate(request)
+        request_message = _validate_message(request)
         last_index = get_last_index(self.requests)
         self.requests[last_index + 1] = request_message
 
@@ -168,7 +206,7 @@ class Context(BaseModel):
 
         :param response: `response` to be added to the context.
         """
-        response_message = Message.model_validate(response)
+        response_message = _validate_message(response)
         last_index = get_last_index(self.responses)
         self.responses[last_index + 1] = response_message
 
@@ -198,16 +236,13 @@ class Context(BaseModel):
         """
         field_names = field_names if isinstance(field_names, set) else set(field_names)
         if "requests" in field_names:
-            for index in list(self.requests)[:-hold_last_n_indices]:
-                del self.requests[index]
+            _hold_last_items(self.requests, hold_last_n_indices)
         if "responses" in field_names:
-            for index in list(self.responses)[:-hold_last_n_indices]:
-                del self.responses[index]
+            _hold_last_items(self.responses, hold_last_n_indices)
         if "misc" in field_names:
             self.misc.clear()
         if "labels" in field_names:
-            for index in list(self.labels)[:-hold_last_n_indices]:
-                del self.labels[index]
+            _hold_last_items(self.labels, hold_last_n_indices)
         if "framework_data" in field_names:
             self.framework_data = FrameworkData()
 
@@ -240,7 +275,7 @@ class Context(BaseModel):
         Required for use with various response wrappers.
         """
         last_index = get_last_index(self.responses)
-        self.responses[last_index] = Message() if response is None else Message.model_validate(response)
+        self.responses[last_index] = _EMPTY_MESSAGE.model_copy() if response is None else _validate_message(response)
 
     @property
     def last_request(self) -> Optional[Message]:
@@ -258,7 +293,7 @@ class Context(BaseModel):
         Required for use with various request wrappers.
         """
         last_index = get_last_index(self.requests)
-        self.requests[last_index] = Message() if request is None else Message.model_validate(request)
+        self.requests[last_index] = _EMPTY_MESSAGE.model_copy() if request is None else _validate_message(request)
 
     @property
     def current_node(self) -> Optional[Node]:
@@ -8,6 +8,7 @@ Chatsky. It only contains types and properties that are compatible with most mes
 from typing import Literal, Optional, List, Union
 from pathlib import Path
 from urllib.request import urlopen
+import asyncio
 import uuid
 import abc
 
@@ -18,6 +19,17 @@ from chatsky.messengers.common.interface import MessengerInterfaceWithAttachment
 from chatsky.utils.devel import JSONSerializableDict, PickleEncodedValue, JSONSerializableExtras
 
 
+def _download_bytes(url: str) -> bytes:
+    """
+    Download contents of the given URL.
+    This function is blocking, so it should be run in an executor when called from a coroutine.
+
+    :param url: URL to download.
+    """
+    with urlopen(url) as response:
+        return response.read()
+
+
 class DataModel(JSONSerializableExtras):
     """
     This class is a Pydantic BaseModel that can have any type and number of extras.
@@ -132,17 +144,25 @@ class DataAttachment(Attachment):
     :py:meth:`~.MessengerInterfaceWithAttachments.get_attachment_bytes` is used to retrieve bytes from ID.
     """
 
+    def _get_cache_filename(self, directory: Path) -> Path:
+        """
+        Get path to the cached version of this attachment.
+        File has a UUID name based on its `self.source` or `self.id`.
+
+        :param directory: cache directory where attachment is saved.
+        """
+
+        return directory / str(uuid.uuid5(uuid.NAMESPACE_URL, str(self.source or self.id)))
+
     async def _cache_attachment(self, data: bytes, directory: Path) -> None:
         """
         Cache attachment, save bytes into a file.
-        File has a UUID name based on its `self.source` or `self.id`.
 
         :param data: attachment data bytes.
         :param directory: cache directory where attachment will be saved.
         """
 
-        filename = str(uuid.uuid5(uuid.NAMESPACE_URL, str(self.source or self.id)))
-        self.cached_filename = directory / filename
+        self.cached_filename = self._get_cache_filename(directory)
         self.cached_filename.write_bytes(data)
 
     async def get_bytes(self, from_interface: MessengerInterfaceWithAttachments) -> Optional[bytes]:
@@ -150,6 +170,7 @@ class DataAttachment(Attachment):
         Retrieve attachment bytes.
         If the attachment is represented by URL or saved in a file,
         it will be downloaded or read automatically.
+        URLs are downloaded in the default executor, so that the event loop isn't blocked.
         If cache use is allowed and the attachment is cached, cached file will be used.
         Otherwise, a :py:meth:`~.MessengerInterfaceWithAttachments.get_attachment_bytes`
         will be used for receiving attachment bytes via ID.
@@ -166,8 +187,8 @@ class DataAttachment(Attachment):
             with open(self.cached_filename, "rb") as file:
                 return file.read()
         elif isinstance(self.source, Url):
-            with urlopen(self.source.unicode_string()) as url:
-                attachment_data = url.read()
+            loop = asyncio.get_running_loop()
+            attachment_data = await loop.run_in_executor(None, _download_bytes, self.source.unicode_string())
         else:
             attachment_data = await from_interface.get_attachment_bytes(self.id)
         if self.use_cache:
@@ -24,7 +24,15 @@ def choice(*responses):
     :param responses: A list of responses for random sampling.
     """
 
-    def choice_response_handler(ctx: Context, pipeline: Pipeline):
-        return random.choice(responses)
+    if len(responses) == 1:
+        (response,) = responses
+
+        def choice_response_handler(ctx: Context, pipeline: Pipeline):
+            return response
+
+    else:
+
+        def choice_response_handler(ctx: Context, pipeline: Pipeline):
+            return random.choice(responses)
 
     return choice_response_handler
@@ -11,7 +11,8 @@ Detailed examples can be found in the `tutorials` section.
 
 """
 
-from datetime import datetime
+from datetime import timedelta
+from time import perf_counter
 
 from chatsky.script import Context
 from chatsky.pipeline import ExtraHandlerRuntimeInfo, Pipeline
@@ -39,8 +40,7 @@ async def get_timing_before(ctx: Context, _, info: ExtraHandlerRuntimeInfo):
     Store the pipeline component's start time inside the context.
     This function is required for running the dashboard with the default configuration.
     """
-    start_time = datetime.now()
-    ctx.framework_data.stats[get_extra_handler_name(info, "time")] = start_time
+    ctx.framework_data.stats[get_extra_handler_name(info, "time")] = perf_counter()
 
 
 async def get_timing_after(ctx: Context, _, info: ExtraHandlerRuntimeInfo):  # noqa: F811
@@ -52,7 +52,7 @@ async def get_timing_after(ctx: Context, _, info: ExtraHandlerRuntimeInfo):  # n
     start_time = ctx.framework_data.stats.pop(get_extra_handler_name(info, "time"), None)
     if start_time is None:
         return None
-    data = {"execution_time": str(datetime.now() - start_time)}
+    data = {"execution_time": str(timedelta(seconds=perf_counter() - start_time))}
     return data
 
 
@@ -60,10 +60,12 @@ async def get_last_response(ctx: Context, _, info: ExtraHandlerRuntimeInfo):
     """
     Extract the text of the last response in the current context.
     This handler is best used together with the `ACTOR` component.
+    If there are no responses in the context yet, `None` is extracted.
 
     This function is required to enable charts that aggregate requests and responses.
     """
-    data = {"last_response": ctx.last_response.text}
+    last_response = ctx.last_response
+    data = {"last_response": last_response.text if last_response is not None else None}
     return data
 
 
@@ -71,10 +73,12 @@ async def get_last_request(ctx: Context, _, info: ExtraHandlerRuntimeInfo):
     """
     Extract the text of the last request in the current context.
     This handler is best used together with the `ACTOR` component.
+    If there are no requests in the context yet, `None` is extracted.
 
     This function is required to enable charts that aggregate requests and responses.
     """
-    data = {"last_request": ctx.last_request.text}
+    last_request = ctx.last_request
+    data = {"last_request": last_request.text if last_request is not None else None}
     return data
 
 
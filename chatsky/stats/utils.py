@@ -14,6 +14,7 @@ The functions below can be used to configure the opentelemetry destination.
 
 import json
 import getpass
+from functools import lru_cache
 from urllib import parse
 from typing import Optional, Tuple
 from argparse import Namespace, Action
@@ -97,8 +98,16 @@ def get_extra_handler_name(info: ExtraHandlerRuntimeInfo, postfix: str = "") ->
     :param info: Handler runtime info obtained from the pipeline.
     :param postfix: Field-specific postfix that will be appended to the field name.
     """
+    return _get_extra_handler_key(info.component.path, postfix)
 
-    path = info.component.path.replace(".", "-")
+
+@lru_cache(maxsize=None)
+def _get_extra_handler_key(path: str, postfix: str) -> str:
+    """
+    Build the context key for the component `path` and `postfix`.
+    The set of component paths is fixed by the pipeline, so the keys are cached.
+    """
+    path = path.replace(".", "-")
     return f"{path}" + (f"-{postfix}" if postfix else "")
 
 
@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Union, Set, Literal
 import json
 
+_METRICS = ("write", "read", "update", "read+update")
+"""Names of the averaged metrics displayed for each benchmark case."""
+
 
 def report(
     file: Union[str, Path],
@@ -35,32 +38,26 @@ def report(
         file_contents = json.load(fd)
 
     sep = "-" * 80
+    benchmark_sep = f"\n{sep}\n"
 
-    report_result = "\n".join([sep, file_contents["name"], sep, file_contents["description"], sep, ""])
+    print("\n".join([sep, file_contents["name"], sep, file_contents["description"], sep, ""]), end="")
 
     for benchmark in file_contents["benchmarks"]:
+        if benchmark["success"]:
+            average_results = benchmark["average_results"]
+            metrics = "".join(
+                f"{metric.title() + ': ' + str(average_results['pretty_' + metric]):20}" for metric in _METRICS
+            )
+        else:
+            metrics = benchmark["result"]
         reported_values = {
             "name": benchmark["name"],
             "desc": benchmark["description"],
             "config": "\n".join(f"{k}: {v}" for k, v in benchmark["benchmark_config"].items()),
-            "metrics": "".join(
-                [
-                    (
-                        f"{metric.title() + ': ' + str(benchmark['average_results']['pretty_' + metric]):20}"
-                        if benchmark["success"]
-                        else benchmark["result"]
-                    )
-                    for metric in ("write", "read", "update", "read+update")
-                ]
-            ),
+            "metrics": metrics,
         }
 
-        result = []
-        for value_name, value in reported_values.items():
-            if value_name in display:
-                result.append(value)
+        result = [value for value_name, value in reported_values.items() if value_name in display]
         result.append("")
 
-        report_result += f"\n{sep}\n".join(result)
-
-    print(report_result, end="")
+        print(benchmark_sep.join(result), end="")
@@ -1,3 +1,3 @@
 # -*- coding: utf-8 -*-
 
-from .singleton_turn_caching import cache_clear, lru_cache, cache
+from .singleton_turn_caching import cache_clear, lru_cache, cache, start_turn_caching, stop_turn_caching
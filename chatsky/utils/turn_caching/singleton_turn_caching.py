@@ -5,12 +5,20 @@ This module contains functions for caching function results on each dialog turn.
 """
 
 import functools
-from typing import Callable, List, Optional
+from contextvars import ContextVar, Token
+from typing import Callable, Dict, List, Optional
 
 
 USED_CACHES: List[Callable] = list()
 """Cache singleton, it is common for all actors and pipelines in current environment."""
 
+TURN_CACHES: ContextVar = ContextVar("turn_caches", default=None)
+"""
+Caches of the dialog turn that is currently processed, mapping cached functions to their turn caches.
+Each pipeline turn sets its own mapping, so concurrently processed turns do not share or clear each other's caches.
+Outside of a turn it is `None` and the singleton caches from :py:data:`USED_CACHES` are used.
+"""
+
 
 def cache_clear():
     """
@@ -20,21 +28,54 @@ def cache_clear():
         used_cache.cache_clear()
 
 
+def start_turn_caching() -> Token:
+    """
+    Function for turn caches creation, it is called in the beginning of pipeline execution turn.
+    All the cached functions called during the turn will use the new caches.
+
+    :return: Token that should be passed to :py:func:`stop_turn_caching` in the end of the turn.
+    """
+    return TURN_CACHES.set(dict())
+
+
+def stop_turn_caching(token: Token):
+    """
+    Function for turn caches removal, it is called in the end of pipeline execution turn.
+
+    :param token: Token returned by :py:func:`start_turn_caching` in the beginning of the turn.
+    """
+    TURN_CACHES.reset(token)
+
+
 def lru_cache(maxsize: Optional[int] = None, typed: bool = False) -> Callable:
     """
     Decorator function for caching function results in scripts.
     Works like the standard :py:func:`~functools.lru_cache` function.
-    Caches are kept in a library-wide singleton and cleared in the end of each turn.
+    Caches are kept separately for each turn processed by pipeline and dropped in the end of the turn;
+    outside of pipeline turns, caches are kept in a library-wide singleton.
+    `cache_info` and `cache_clear` of the decorated function refer to the cache currently in use.
     """
 
     def decorator(func):
         global USED_CACHES
 
+        cached_func = functools.lru_cache(maxsize=maxsize, typed=typed)(func)
+
+        def get_current_cached_func() -> Callable:
+            turn_caches: Optional[Dict[Callable, Callable]] = TURN_CACHES.get()
+            if turn_caches is None:
+                return cached_func
+            turn_cached_func = turn_caches.get(wrapper)
+            if turn_cached_func is None:
+                turn_cached_func = turn_caches[wrapper] = functools.lru_cache(maxsize=maxsize, typed=typed)(func)
+            return turn_cached_func
+
         @functools.wraps(func)
-        @functools.lru_cache(maxsize=maxsize, typed=typed)
         def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+            return get_current_cached_func()(*args, **kwargs)
 
+        wrapper.cache_info = lambda: get_current_cached_func().cache_info()
+        wrapper.cache_clear = lambda: get_current_cached_func().cache_clear()
         USED_CACHES += [wrapper]
         return wrapper
 
@@ -45,6 +86,7 @@ def cache(func):
     """
     Decorator function for caching function results in scripts.
     Works like the standard :py:func:`~functools.cache` function.
-    Caches are kept in a library-wide singleton and cleared in the end of each turn.
+    Caches are kept separately for each turn processed by pipeline and dropped in the end of the turn;
+    outside of pipeline turns, caches are kept in a library-wide singleton.
     """
     return lru_cache(maxsize=None)(func)
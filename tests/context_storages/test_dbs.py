@@ -20,6 +20,7 @@ from chatsky.context_storages import (
     context_storage_factory,
 )
 
+from chatsky.context_storages.database import _ReadWriteLock
 from chatsky.script import Context
 from chatsky.utils.testing.cleanup_db import (
     delete_shelve,
@@ -171,6 +172,60 @@ def test_sqlite(testing_file, testing_context, context_id):
     asyncio.run(delete_sql(db))
 
 
+@pytest.mark.skipif(not sqlite_available, reason="Sqlite dependencies missing")
+def test_sqlite_in_memory(testing_context, context_id):
+    db = context_storage_factory("sqlite+aiosqlite://")
+    generic_test(db, testing_context, context_id)
+    asyncio.run(delete_sql(db))
+
+
+@pytest.mark.skipif(not sqlite_available, reason="Sqlite dependencies missing")
+def test_concurrent_keys(testing_file):
+    separator = "///" if system() == "Windows" else "////"
+    db = context_storage_factory(f"sqlite+aiosqlite:{separator}{testing_file}")
+
+    async def write_and_read(key: str):
+        await db.set_item_async(key, Context(id=key))
+        return await db.get_item_async(key)
+
+    async def run_concurrently():
+        return await asyncio.gather(*[write_and_read(str(key % 3)) for key in range(9)])
+
+    contexts = asyncio.run(run_concurrently())
+    assert [ctx.id for ctx in contexts] == [str(key % 3) for key in range(9)]
+    assert len(db) == 3
+    assert db._key_locks == {} and db._key_lock_users == {}
+    asyncio.run(delete_sql(db))
+
+
+@pytest.mark.skipif(not sqlite_available, reason="Sqlite dependencies missing")
+def test_context_cache(testing_file):
+    separator = "///" if system() == "Windows" else "////"
+    db = context_storage_factory(f"sqlite+aiosqlite:{separator}{testing_file}", cache_size=2)
+    for key in ("1", "2", "3"):
+        db[key] = Context(id=key)
+    assert list(db._cache) == ["2", "3"]
+
+    ctx = db["2"]
+    ctx.misc["changed"] = True
+    assert db["2"].misc == {}
+    assert list(db._cache) == ["3", "2"]
+    assert db["1"].id == "1"
+    assert list(db._cache) == ["2", "1"]
+
+    del db["1"]
+    assert "1" not in db._cache and "1" not in db
+    db.clear()
+    assert len(db._cache) == 0
+
+    async def write_and_clear():
+        await asyncio.gather(db.set_item_async("4", Context(id="4")), db.clear_async())
+
+    asyncio.run(write_and_clear())
+    assert "4" not in db and db.get("4") is None and len(db._cache) == 0
+    asyncio.run(delete_sql(db))
+
+
 @pytest.mark.skipif(not MYSQL_ACTIVE, reason="Mysql server is not running")
 @pytest.mark.skipif(not mysql_available, reason="Mysql dependencies missing")
 @pytest.mark.docker
@@ -199,3 +254,34 @@ def test_ydb(testing_context, context_id):
     )
     generic_test(db, testing_context, context_id)
     asyncio.run(delete_ydb(db))
+
+
+def test_read_write_lock():
+    async def run_concurrently():
+        lock = _ReadWriteLock()
+        order = []
+
+        async def read(name: str):
+            await lock.acquire_read()
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+            await lock.release_read()
+
+        async def write(name: str):
+            await lock.acquire_write()
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+            await lock.release_write()
+
+        first_reads = [asyncio.create_task(read("read1")), asyncio.create_task(read("read2"))]
+        await asyncio.sleep(0)
+        writing = asyncio.create_task(write("write"))
+        await asyncio.sleep(0)
+        await asyncio.gather(*first_reads, writing, read("read3"))
+        return order
+
+    order = asyncio.run(run_concurrently())
+    assert order[:2] == ["read1 start", "read2 start"]
+    assert order[4:] == ["write start", "write end", "read3 start", "read3 end"]
@@ -1,10 +1,15 @@
+import asyncio
 import importlib
+from dataclasses import dataclass
 
-from chatsky.script import Message
+import pytest
+
+from chatsky.script import Context, Message
 from tests.test_utils import get_path_from_tests_to_current_dir
-from chatsky.pipeline import Pipeline
+from chatsky.pipeline import Pipeline, Service, GlobalExtraHandlerType, all_condition, any_condition
 from chatsky.script.core.keywords import RESPONSE, TRANSITIONS
 import chatsky.script.conditions as cnd
+from chatsky.utils.turn_caching import cache
 
 
 dot_path_to_addon = get_path_from_tests_to_current_dir(__file__, separator=".")
@@ -22,3 +27,67 @@ def test_script_getting_and_setting():
     new_script = {"new_flow": {"": {RESPONSE: lambda _, __: Message(), TRANSITIONS: {"": cnd.false()}}}}
     pipeline.set_actor(script=new_script, start_label=("new_flow", ""))
     assert list(pipeline.script.script.keys())[0] == list(new_script.keys())[0]
+
+
+def test_aggregated_conditions_short_circuit():
+    called = []
+
+    def condition(result):
+        def inner(_, __):
+            called.append(result)
+            return result
+
+        return inner
+
+    assert not all_condition(condition(True), condition(False), condition(True))(None, None)
+    assert called == [True, False]
+
+    called.clear()
+    assert any_condition(condition(False), condition(True), condition(False))(None, None)
+    assert called == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_turn_caches_are_isolated():
+    calls = []
+
+    @cache
+    def cached_function(argument):
+        calls.append(argument)
+        return len(calls)
+
+    async def service(ctx: Context):
+        ctx.misc["first"] = cached_function(1)
+        await asyncio.sleep(0)
+        ctx.misc["second"] = cached_function(1)
+        ctx.misc["hits"] = cached_function.cache_info().hits
+
+    script = {"flow": {"node": {RESPONSE: Message(), TRANSITIONS: {"node": cnd.true()}}}}
+    pipeline = Pipeline.from_script(script=script, start_label=("flow", "node"), pre_services=[service])
+
+    ctx_1, ctx_2 = await asyncio.gather(pipeline._run_pipeline(Message(), 1), pipeline._run_pipeline(Message(), 2))
+    assert ctx_1.misc["first"] == ctx_1.misc["second"]
+    assert ctx_2.misc["first"] == ctx_2.misc["second"]
+    assert ctx_1.misc["first"] != ctx_2.misc["first"]
+    assert ctx_1.misc["hits"] == ctx_2.misc["hits"] == 1
+
+    ctx_1 = await pipeline._run_pipeline(Message(), 1)
+    assert ctx_1.misc["first"] == ctx_1.misc["second"] == 3
+    assert cached_function.cache_info().currsize == 0
+
+
+def test_unhashable_callable_handlers():
+    @dataclass
+    class Handler:
+        key: str
+
+        def __call__(self, ctx: Context, _):
+            ctx.misc[self.key] = True
+
+    service = Service(handler=Handler("service"), before_handler=[Handler("before")])
+    service.add_extra_handler(GlobalExtraHandlerType.AFTER, Handler("added"))
+    script = {"flow": {"node": {RESPONSE: Message(), TRANSITIONS: {"node": cnd.true()}}}}
+    pipeline = Pipeline.from_script(script=script, start_label=("flow", "node"), pre_services=[service])
+
+    ctx = asyncio.run(pipeline._run_pipeline(Message(), 1))
+    assert ctx.misc == {"service": True, "before": True, "added": True}
@@ -2,6 +2,7 @@
 import random
 
 from chatsky.script import Context, Message
+from chatsky.script.core.context import get_last_index
 
 
 def shuffle_dict_keys(dictionary: dict) -> dict:
@@ -52,8 +53,53 @@ def test_context():
     assert ctx.misc == {"1001": "11111"}
     assert ctx.current_node is None
     ctx.model_dump_json()
+    assert Context.cast(ctx.model_dump_json().encode()).requests == ctx.requests
 
     try:
         Context.cast(123)
     except ValueError:
         pass
+
+
+def test_empty_context_last_items():
+    ctx = Context()
+    assert get_last_index(ctx.requests) == get_last_index(ctx.responses) == get_last_index(ctx.labels) == -1
+    assert ctx.last_request is None
+    assert ctx.last_response is None
+    assert ctx.last_label is None
+
+    ctx.add_request(Message("request"))
+    ctx.add_label(("flow", "node"))
+    ctx.add_response(Message("response"))
+    assert ctx.requests == {0: Message("request")}
+    assert ctx.last_request == Message("request")
+    assert ctx.last_response == Message("response")
+    assert ctx.last_label == ("flow", "node")
+
+
+def test_non_contiguous_indices():
+    ctx = Context(
+        requests={9: Message("9"), 1: Message("1"), 5: Message("5")},
+        responses={7: Message("7"), 3: Message("3")},
+        labels={6: ("flow", "6"), 2: ("flow", "2")},
+    )
+    assert get_last_index(ctx.requests) == 9
+    assert get_last_index(ctx.responses) == 7
+    assert get_last_index(ctx.labels) == 6
+    assert ctx.last_request == Message("9")
+    assert ctx.last_response == Message("7")
+    assert ctx.last_label == ("flow", "6")
+
+    ctx.add_request(Message("10"))
+    ctx.add_response(Message("8"))
+    ctx.add_label(("flow", "7"))
+    assert list(ctx.requests) == [1, 5, 9, 10]
+    assert ctx.last_request == Message("10")
+    assert ctx.last_response == Message("8")
+    assert ctx.last_label == ("flow", "7")
+
+    ctx.clear(2)
+    assert ctx.requests == {9: Message("9"), 10: Message("10")}
+    assert ctx.responses == {7: Message("7"), 8: Message("8")}
+    assert ctx.labels == {6: ("flow", "6"), 7: ("flow", "7")}
+    assert ctx.last_request == Message("10")
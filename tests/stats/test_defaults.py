@@ -2,7 +2,7 @@ import importlib
 
 import pytest
 
-from chatsky.script import Context
+from chatsky.script import Context, Message
 from chatsky.pipeline import Pipeline
 from chatsky.pipeline.types import ExtraHandlerRuntimeInfo, ServiceRuntimeInfo
 
@@ -58,3 +58,16 @@ async def test_otlp_integration(context, tracer_exporter_and_provider, log_expor
     tracer_provider.force_flush()
     logger_provider.force_flush()
     assert len(log_exporter.get_finished_logs()) > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "context,expected",
+    [
+        (Context(), {"last_request": None}),
+        (Context(requests={0: Message("hi")}), {"last_request": "hi"}),
+    ],
+)
+async def test_get_last_request(context: Context, expected: dict):
+    result = await default_extractors.get_last_request(context, None, None)
+    assert result == expected
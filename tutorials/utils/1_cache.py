@@ -9,8 +9,9 @@ function is demonstrated.
 This function is used a lot like `functools.cache` function and
 helps by saving results of heavy function execution and avoiding recalculation.
 
-Caches are kept in a library-wide singleton
-and are cleared at the end of each turn.
+Each turn processed by pipeline gets its own caches,
+which are dropped at the end of the turn,
+so concurrently processed turns do not share cached values.
 """
 
 # %pip install chatsky
@@ -40,8 +41,8 @@ def cached_response(_):
     If the function will be called again
     with the same arguments it will prevent it from execution.
     The cached values will be used instead.
-    The cache is stored in a library-wide singleton,
-    that is cleared in the end of execution of actor and/or pipeline.
+    The cache belongs to the current pipeline turn
+    and is dropped at the end of the turn.
     """
     external_data["counter"] += 1
     return external_data["counter"]
@@ -9,8 +9,9 @@ function is demonstrated.
 This function is used a lot like `functools.lru_cache` function and
 helps by saving results of heavy function execution and avoiding recalculation.
 
-Caches are kept in a library-wide singleton
-and are cleared at the end of each turn.
+Each turn processed by pipeline gets its own caches,
+which are dropped at the end of the turn,
+so concurrently processed turns do not share cached values.
 
 Maximum size parameter limits the amount of function execution results cached.
 """